@@ -18,7 +18,8 @@ from netCDF4 import Dataset
 # dimensions  = lat and lon limits
 # Lat         = 0.1 degree lat indices
 # Lon         = 0.1 degree lon indices
-def initialize_netCDF(outfilename, description, monthflag, year_range, dimensions, Lat, Lon):
+# data        = (optional) emission flux array to write to emi_ch4 before the file is closed
+def initialize_netCDF(outfilename, description, monthflag, year_range, dimensions, Lat, Lon, data=None):
     #set monthflag to 0 if annual (not monthly) data
     #Initialize file
     nc_out = Dataset(outfilename, 'w', format='NETCDF4')
@@ -65,11 +66,13 @@ def initialize_netCDF(outfilename, description, monthflag, year_range, dimension
     year[:] = np.arange(year_range[0],year_range[-1]+1) #add one because the range is not inclusive
     if monthflag ==1:
         month[:] = np.arange(1,13)
+    if data is not None:
+        data_out[:] = data
         
     nc_out.close()
     
     
-def initialize_netCDF001(outfilename, description, monthflag, year_range, dimensions, Lat, Lon):
+def initialize_netCDF001(outfilename, description, monthflag, year_range, dimensions, Lat, Lon, data=None):
     #set monthflag to 0 if annual (not monthly) data
     #Initialize file
     nc_out = Dataset(outfilename, 'w', format='NETCDF4')
@@ -116,5 +119,7 @@ def initialize_netCDF001(outfilename, description, monthflag, year_range, dimens
     year[:] = np.arange(year_range[0],year_range[-1]+1) #add one because the range is not inclusive
     if monthflag ==1:
         month[:] = np.arange(1,13)
+    if data is not None:
+        data_out[:] = data
         
     nc_out.close()
\ No newline at end of file
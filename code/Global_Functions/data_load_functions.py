@@ -6,6 +6,7 @@
 # Feb. 26, 2021
 
 # Import modules
+import shelve
 import pandas as pd
 import numpy as np
 # Load netCDF (for manipulating netCDF file types)
@@ -32,10 +33,12 @@ def load_global_file_names():
 #Load grid cell areas (m2), and lat and lon values for 0.01x0.01 grid
 def load_area_map_001(Grid_area001_inputfile):
     #Read area map (0.01x0.01 degrees)
+    #(auto-masking is off so variables are read straight into plain arrays, without a masked copy)
     area_file = Dataset(Grid_area001_inputfile)
-    area_map001 = np.array(area_file.variables['cell_area'])
-    lon001 = np.array(area_file.variables['lon'])
-    lat001 = np.array(area_file.variables['lat'])
+    area_file.set_auto_mask(False)
+    area_map001 = area_file.variables['cell_area'][:]
+    lon001 = area_file.variables['lon'][:]
+    lat001 = area_file.variables['lat'][:]
     area_file.close()
     #Get rid of missing values
     area_map001[area_map001 > 1.e+14] = 0
@@ -46,18 +49,18 @@ def load_area_map_001(Grid_area001_inputfile):
 def load_area_map_01(Grid_area01_inputfile):
     #Read area map (0.1x0.1 degrees)
     area_file = Dataset(Grid_area01_inputfile)
-    area_map01 = np.array(area_file.variables['cell_area'])
-    lon01 = np.array(area_file.variables['LON'])
-    lat01 = np.array(area_file.variables['LAT'])
+    area_file.set_auto_mask(False)
+    area_map01 = area_file.variables['cell_area'][:]
+    lon01 = area_file.variables['LON'][:]
+    lat01 = area_file.variables['LAT'][:]
     area_file.close()
     return(area_map01, lat01, lon01)
 
 # Load Population Density map for 0.01x0.01 degree grid
 def load_pop_den_map(pop_map_inputfile):
     pop_file = Dataset(pop_map_inputfile)
-    pop_den_map001 = np.array(pop_file.variables['pop_density'])
-    Lon = np.array(pop_file.variables['lon'])
-    Lat = np.array(pop_file.variables['lat'])
+    pop_file.set_auto_mask(False)
+    pop_den_map001 = pop_file.variables['pop_density'][:]
     pop_file.close()
     #Set missing values to zero
     pop_den_map001[pop_den_map001 > 1] = 0.0
@@ -66,14 +69,16 @@ def load_pop_den_map(pop_map_inputfile):
 # Load State ANSI ID map for 0.01x0.01 degree grid
 def load_state_ansi_map(Grid_state001_ansi_inputfile):
     state_file = Dataset(Grid_state001_ansi_inputfile)
-    state_ANSI_map001 = np.array(state_file.variables['data'])
+    state_file.set_auto_mask(False)
+    state_ANSI_map001 = state_file.variables['data'][:]
     state_file.close()
     return(state_ANSI_map001)
 
 # Load County ANSI ID map for 0.01x0.01 degree grid
 def load_county_ansi_map(Grid_county001_ansi_inputfile):
     county_file = Dataset(Grid_county001_ansi_inputfile)
-    county_ANSI_map001 = np.array(county_file.variables['data'])
+    county_file.set_auto_mask(False)
+    county_ANSI_map001 = county_file.variables['data'][:]
     county_file.close()
     return(county_ANSI_map001)
     
@@ -89,4 +94,15 @@ def load_state_ansi(state_ansi_inputfile):
     name_dict = State_ANSI.set_index('name')['ansi'].to_dict()
     
     return(State_ANSI, name_dict, abbr_dict)
-    
\ No newline at end of file
+    
+
+# Geocode an address, keeping results in an on-disk cache so that reruns do not query the geocoding server again
+# geolocator = geopy geocoder (e.g., Nominatim)
+# address    = address string to geocode
+# cachefile  = path of the cache file (created if it does not exist)
+# output     = geopy location (or None if the address was not found)
+def geocode_cached(geolocator, address, cachefile):
+    with shelve.open(cachefile) as cache:
+        if address not in cache:
+            cache[address] = geolocator.geocode(address)
+        return(cache[address])